@@ -0,0 +1,52 @@
+"""add lookup indexes
+
+Revision ID: 8b2e4d6f1a35
+Revises: 3f1c9a2b7d10
+Create Date: 2026-10-14 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a35'
+down_revision: Union[str, None] = '3f1c9a2b7d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The trigram operator class used by ix_movies_genre_trgm comes from pg_trgm
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # The unique index can't be built over duplicate ratings; leave resolving them to the operator
+    # (offline --sql output can't query, and CREATE UNIQUE INDEX fails on duplicates there anyway)
+    if not context.is_offline_mode():
+        duplicates = op.get_bind().scalar(sa.text(
+            "SELECT count(*) FROM (SELECT 1 FROM ratings GROUP BY movie_id, user_id HAVING count(*) > 1) AS d"
+        ))
+        if duplicates:
+            raise RuntimeError(
+                f"{duplicates} (movie_id, user_id) pairs have more than one rating; "
+                "remove the duplicates before running this migration"
+            )
+    op.create_index('ix_rating_movie_user', 'ratings', ['movie_id', 'user_id'], unique=True)
+    op.create_index('ix_ratings_user_id', 'ratings', ['user_id'], unique=False)
+    op.create_index('ix_comments_movie_id', 'comments', ['movie_id'], unique=False)
+    op.create_index('ix_replies_comment_id', 'replies', ['comment_id'], unique=False)
+    op.create_index('ix_movies_genre_trgm', 'movies', ['genre'], unique=False, postgresql_using='gin', postgresql_ops={'genre': 'gin_trgm_ops'})
+    # The unique index on email replaces the original unique constraint
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.drop_constraint('users_email_key', 'users', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_index('ix_movies_genre_trgm', table_name='movies', postgresql_using='gin')
+    op.drop_index('ix_replies_comment_id', table_name='replies')
+    op.drop_index('ix_comments_movie_id', table_name='comments')
+    op.drop_index('ix_ratings_user_id', table_name='ratings')
+    op.drop_index('ix_rating_movie_user', table_name='ratings')
@@ -15,6 +15,9 @@ class Settings(BaseSettings):
     secret_key: str
     algorithm: str
     access_token_expire_minutes: int
+    run_create_all: bool = False  # Create missing tables on startup instead of relying on migrations
+    bcrypt_rounds: int = 12  # bcrypt cost factor; tests lower it since each extra round doubles the hashing work
+    testing: bool = False  # Test profile: trades production-grade password hashing for speed
 
     class Config:
         """
@@ -1,7 +1,48 @@
-from sqlalchemy.orm import Session, joinedload
+import csv
+import io
+import psycopg2
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
 from fastapi import Depends
 from . import database
 
+class _CSVLineReader:
+    """
+    Minimal file-like object that serves CSV lines from an iterator of rows on demand,
+    so COPY can stream a file without it ever being held in memory as a whole.
+    """
+    def __init__(self, rows):
+        self._lines = self._format(rows)
+        self._buffer = ""
+        self.error = None  # ValueError raised while reading the rows, if any
+
+    @staticmethod
+    def _format(rows):
+        line = io.StringIO()
+        writer = csv.writer(line, lineterminator="\n")
+        for row in rows:
+            writer.writerow(row)
+            yield line.getvalue()
+            line.seek(0)
+            line.truncate()
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            try:
+                next_line = next(self._lines, None)
+            except ValueError as error:
+                # psycopg2 only reports that read() failed, so keep the original error for the caller
+                self.error = error
+                raise
+            if next_line is None:
+                break
+            self._buffer += next_line
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
 class CRUDService:
     def __init__(self, db: Session = Depends(database.get_db)):
         """
@@ -30,6 +71,79 @@ class CRUDService:
         self.db.refresh(model_obj)  # Refresh to get the updated record with any database defaults
         return model_obj
 
+    def bulk_create(self, data_objs, model, current_user):
+        """
+        Create several records in a single INSERT and transaction.
+        
+        Args:
+            data_objs: List of data objects with values to be inserted into the database.
+            model: SQLAlchemy model class representing the table.
+            current_user: The currently authenticated user, used to set user_id in every record.
+        
+        Returns:
+            List: The created record objects.
+        """
+        rows = [{**data_obj.model_dump(), "user_id": current_user.id} for data_obj in data_objs]
+        if not rows:
+            return []
+        # One executemany round trip instead of an add/commit/refresh per record
+        model_objs = self.db.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows).all()
+        self.db.commit()
+        return model_objs
+
+    def bulk_ingest_movies(self, csv_file, model, current_user):
+        """
+        Load movies from a CSV file using PostgreSQL's COPY.
+        
+        Args:
+            csv_file: Text file object with a header row containing title, genre and director columns.
+            model: SQLAlchemy model class representing the movie table.
+            current_user: The currently authenticated user, recorded as the owner of every movie.
+        
+        Returns:
+            int: Number of movies loaded.
+        
+        Raises:
+            ValueError: If the CSV header is missing a required column, a row is short of values,
+                or PostgreSQL rejects the data. Nothing is loaded in that case.
+        """
+        columns = ["title", "genre", "director"]
+        reader = csv.DictReader(csv_file)
+        missing = [column for column in columns if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"CSV file is missing columns: {', '.join(missing)}")
+
+        def rows():
+            # Reorder each row to the COPY column list and append the owner's id
+            for row in reader:
+                values = [row[column] for column in columns]
+                if None in values:  # DictReader fills the columns of a short row with None
+                    raise ValueError(f"CSV line {reader.line_num} is missing values")
+                yield values + [current_user.id]
+
+        # FORCE_NOT_NULL loads an empty field as an empty string rather than NULL
+        copy_sql = (
+            f"COPY {model.__tablename__} ({', '.join(columns)}, user_id) FROM STDIN "
+            f"WITH (FORMAT csv, FORCE_NOT_NULL ({', '.join(columns)}))"
+        )
+        lines = _CSVLineReader(rows())
+        # Use the session's own DBAPI connection so the COPY runs inside its transaction
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(copy_sql, lines)
+            count = cursor.rowcount
+        except psycopg2.Error as error:
+            self.db.rollback()
+            if lines.error is not None:
+                raise lines.error from error
+            if isinstance(error, (psycopg2.DataError, psycopg2.IntegrityError)):
+                raise ValueError(f"Invalid CSV data: {error.diag.message_primary}") from error
+            raise
+        finally:
+            cursor.close()
+        self.db.commit()
+        return count
+
     def create_user(self, data_obj, model, hashed_password):
         """
         Create a new user record with hashed password.
@@ -49,6 +163,17 @@ class CRUDService:
         self.db.refresh(model_obj)
         return model_obj
 
+    def update_user_password(self, user, hashed_password):
+        """
+        Replace a user's stored password hash.
+        
+        Args:
+            user: The user record to update.
+            hashed_password: The new hashed password.
+        """
+        user.password = hashed_password
+        self.db.commit()
+
     def get_movie(self, model, limit, skip, search):
         """
         Retrieve a list of movies with optional search filter.
@@ -60,9 +185,24 @@ class CRUDService:
             search: Search term to filter movies by genre.
         
         Returns:
-            List: List of movie records matching the criteria.
+            List: List of movie rows (as dicts, with the user nested) matching the criteria.
         """
-        movies = self.db.query(model).filter(model.genre.contains(search)).limit(limit).offset(skip).all()
+        # Select plain rows instead of ORM objects; response validation builds the models
+        user_model = model.user.property.mapper.class_
+        stmt = select(
+            model.__table__,
+            user_model.email.label("user_email"),
+            user_model.created_at.label("user_created_at"),
+        ).join(user_model, model.user_id == user_model.id)
+        if search:
+            # genre LIKE '%search%' is served by the trigram index on genre
+            stmt = stmt.where(model.genre.contains(search, autoescape=True))
+        stmt = stmt.order_by(model.id).limit(limit).offset(skip)
+        rows = self.db.execute(stmt).mappings()
+        movies = [
+            {**row, "user": {"id": row["user_id"], "email": row["user_email"], "created_at": row["user_created_at"]}}
+            for row in rows
+        ]
         return movies
 
     def get(self, id, model):
@@ -76,7 +216,7 @@ class CRUDService:
         Returns:
             model_obj: The record object if found, otherwise None.
         """
-        model_obj = self.db.query(model).filter(model.id == id).first()
+        model_obj = self.db.get(model, id)  # Checks the identity map before querying by primary key
         if not model_obj:
             return None
         return model_obj
@@ -104,8 +244,12 @@ class CRUDService:
             data_obj: Data object with updated values.
             model: SQLAlchemy model class representing the table.
         """
-        query = self.get_query_by_id(id, model)
-        query.update(data_obj.model_dump(), synchronize_session=False)
+        values = data_obj.model_dump(exclude_unset=True)  # Only write the fields the client sent
+        if not values:
+            return
+        # Sessions don't expire on commit, so apply the new values to any loaded instance as well
+        stmt = update(model).where(model.id == id).values(**values).execution_options(synchronize_session="evaluate")
+        self.db.execute(stmt)
         self.db.commit()
 
     def delete(self, id, model):
@@ -116,8 +260,8 @@ class CRUDService:
             id: ID of the record to delete.
             model: SQLAlchemy model class representing the table.
         """
-        query = self.get_query_by_id(id, model)
-        query.delete(synchronize_session=False)
+        # Related rows are removed by the database's ON DELETE CASCADE
+        self.db.execute(delete(model).where(model.id == id))
         self.db.commit()
 
     def get_user_by_email(self, email, model):
@@ -148,34 +292,30 @@ class CRUDService:
             movie: The movie record with loaded ratings if found, otherwise None.
         """
         query = self.get_query_by_id(id, model)
-        movie = query.options(joinedload(model.ratings)).first()
+        movie = query.options(selectinload(model.ratings)).first()  # Load ratings in one extra IN query, no duplicated movie rows
         if movie:
             return movie
         return None
 
-    def get_existing_rating(self, data_obj, model, current_user):
+    def get_movies_with_children(self, ids, model, child_rel):
         """
-        Check if a user has already rated a specific movie.
+        Retrieve several movies together with one of their child collections.
         
         Args:
-            data_obj: Data object containing the movie ID.
-            model: SQLAlchemy model class representing the rating table.
-            current_user: The currently authenticated user.
+            ids: IDs of the movies to retrieve.
+            model: SQLAlchemy model class representing the movie table.
+            child_rel: Relationship attribute to load, e.g. model.ratings or model.comments.
         
         Returns:
-            existing_rating: The existing rating if found, otherwise None.
-        """
-        existing_rating = self.db.query(model).filter(
-            model.movie_id == data_obj.movie_id,
-            model.user_id == current_user.id
-        ).first()
-        if existing_rating:
-            return existing_rating
-        return None
+            List: Movie records with the child collection loaded.
+        """
+        # One query for the movies and one IN query for all of their children
+        movies = self.db.query(model).filter(model.id.in_(ids)).options(selectinload(child_rel)).order_by(model.id).all()
+        return movies
 
     def rate_movie(self, data_obj, model, current_user):
         """
-        Rate a movie.
+        Rate a movie, unless the user has already rated it.
         
         Args:
             data_obj: Data object containing the rating details.
@@ -183,12 +323,18 @@ class CRUDService:
             current_user: The currently authenticated user.
         
         Returns:
-            rating: The created rating record.
+            rating: The created rating record, or None if the user has already rated this movie.
         """
-        rating = model(user_id=current_user.id, **data_obj.model_dump())
-        self.db.add(rating)
+        # A single atomic INSERT; the unique (movie_id, user_id) index turns a repeat rating into a no-op
+        # ON CONFLICT needs that index to exist, so the add_lookup_indexes migration must be applied first
+        stmt = (
+            pg_insert(model)
+            .values(user_id=current_user.id, **data_obj.model_dump())
+            .on_conflict_do_nothing(index_elements=["movie_id", "user_id"])
+            .returning(model)
+        )
+        rating = self.db.scalars(stmt).first()
         self.db.commit()
-        self.db.refresh(rating)
         return rating
 
     def comment_movie(self, data_obj, model, current_user):
@@ -221,7 +367,7 @@ class CRUDService:
             movie: The movie record with loaded comments if found, otherwise None.
         """
         query = self.get_query_by_id(id, model)
-        movie = query.options(joinedload(model.comments)).first()
+        movie = query.options(selectinload(model.comments)).first()  # Load comments in one extra IN query, no duplicated movie rows
         if movie:
             return movie
         return None
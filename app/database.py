@@ -7,11 +7,25 @@ from .config import settings
 DATABASE_URL = settings.sqlalchemy_database_url
 
 # Create a new SQLAlchemy engine instance, connecting to the specified database URL
-engine = create_engine(DATABASE_URL)
+# The pool keeps warm connections around so requests don't pay a reconnect each time,
+# pre-ping drops connections the server has closed and recycle retires them hourly
+# psycopg2 sends bulk INSERTs as multi-VALUES batches and other executemany calls via execute_batch
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    executemany_mode="values_plus_batch",
+    executemany_batch_page_size=500,
+    insertmanyvalues_page_size=1000,
+)
 
 # Create a new sessionmaker instance bound to the engine
 # SessionLocal is a factory for new Session objects
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False keeps loaded attributes usable after commit without a re-SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
 
 # Create a base class for SQLAlchemy models to inherit from
 Base = declarative_base()
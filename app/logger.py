@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 
 PAPERTRAIL_HOST = "logs2.papertrailapp.com"
 PAPERTRAIL_PORT = 43906
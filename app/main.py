@@ -1,8 +1,9 @@
 # Import necessary modules and classes from FastAPI and other components
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routers import ratings, user, auth, movie, comment
+from .routers import rating, user, auth, movie, comment
 from . import models
+from .config import settings
 from .database import engine 
 
 # Create an instance of the FastAPI class
@@ -20,12 +21,14 @@ app.add_middleware(
     allow_headers=["*"],  
 )
 
-# Create all tables in the database based on the models defined
-models.Base.metadata.create_all(bind=engine)
+# Schema changes are applied with Alembic migrations; creating the tables on every
+# worker startup is opt-in for local development (RUN_CREATE_ALL=true)
+if settings.run_create_all:
+    models.Base.metadata.create_all(bind=engine)
 
 # Include routers for different parts of the application
 app.include_router(user.router) 
 app.include_router(auth.router)  
 app.include_router(movie.router)  
-app.include_router(ratings.router)  
+app.include_router(rating.router)  
 app.include_router(comment.router)  
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, FLOAT, TIMESTAMP, ForeignKey, text
+from sqlalchemy import Column, Integer, String, FLOAT, TIMESTAMP, ForeignKey, Index, DDL, event, text
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -6,7 +6,7 @@ from .database import Base
 class User(Base):
     __tablename__ = "users"  # Table name in the database
     id = Column(Integer, primary_key=True, nullable=False)  # Primary key for the User table
-    email = Column(String, nullable=False, unique=True)  # User email, must be unique
+    email = Column(String, nullable=False, unique=True, index=True)  # User email, must be unique and indexed for login lookups
     password = Column(String, nullable=False)  # User password
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("now()"), nullable=False)  # Timestamp for when the user was created
 
@@ -19,9 +19,21 @@ class Movie(Base):
     director = Column(String, nullable=False)  # Director of the movie
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("now()"), nullable=False)  # Timestamp for when the movie was created
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # Foreign key linking to the User who added the movie
-    user = relationship("User")  # Relationship to the User model
-    ratings = relationship("Rating", back_populates="movie")  # Relationship to the Rating model
-    comments = relationship("Comment", back_populates="movie")  # Relationship to the Comment model
+    user = relationship("User", lazy="joined")  # Relationship to the User model, loaded in the same query
+    # Collections must be loaded explicitly (e.g. selectinload); an implicit lazy load raises instead of hiding an N+1
+    ratings = relationship("Rating", back_populates="movie", lazy="raise_on_sql")  # Relationship to the Rating model
+    comments = relationship("Comment", back_populates="movie", lazy="raise_on_sql")  # Relationship to the Comment model
+    __table_args__ = (
+        # Trigram index so genre substring searches don't scan the whole table
+        Index("ix_movies_genre_trgm", "genre", postgresql_using="gin", postgresql_ops={"genre": "gin_trgm_ops"}),
+    )
+
+# The trigram operator class comes from the pg_trgm extension, which must exist before the index
+event.listen(
+    Movie.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
 
 # Define the Rating model
 class Rating(Base):
@@ -30,9 +42,13 @@ class Rating(Base):
     rating = Column(FLOAT, nullable=False)  # Rating value
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("now()"), nullable=False)  # Timestamp for when the rating was created
     movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False)  # Foreign key linking to the Movie being rated
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # Foreign key linking to the User who made the rating
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)  # Foreign key linking to the User who made the rating
     movie = relationship("Movie", back_populates="ratings")  # Relationship to the Movie model
-    user = relationship("User")  # Relationship to the User model
+    user = relationship("User", lazy="joined")  # Relationship to the User model, loaded in the same query
+    __table_args__ = (
+        # A user rates a movie at most once; also serves lookups by movie_id alone
+        Index("ix_rating_movie_user", "movie_id", "user_id", unique=True),
+    )
 
 # Define the Comment model
 class Comment(Base):
@@ -41,9 +57,9 @@ class Comment(Base):
     content = Column(String, nullable=False)  # Content of the comment
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("now()"), nullable=False)  # Timestamp for when the comment was created
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # Foreign key linking to the User who made the comment
-    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False)  # Foreign key linking to the Movie being commented on
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False, index=True)  # Foreign key linking to the Movie being commented on
     movie = relationship("Movie", back_populates="comments")  # Relationship to the Movie model
-    user = relationship("User")  # Relationship to the User model
+    user = relationship("User", lazy="joined")  # Relationship to the User model, loaded in the same query
 
 # Define the Reply model
 class Reply(Base):
@@ -51,7 +67,7 @@ class Reply(Base):
     id = Column(Integer, primary_key=True, nullable=False)  # Primary key for the Reply table
     reply = Column(String, nullable=False)  # Content of the reply
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("now()"), nullable=False)  # Timestamp for when the reply was created
-    comment_id = Column(Integer, ForeignKey("comments.id", ondelete="CASCADE"), nullable=False)  # Foreign key linking to the Comment being replied to
+    comment_id = Column(Integer, ForeignKey("comments.id", ondelete="CASCADE"), nullable=False, index=True)  # Foreign key linking to the Comment being replied to
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # Foreign key linking to the User who made the reply
-    user = relationship("User")  # Relationship to the User model
+    user = relationship("User", lazy="joined")  # Relationship to the User model, loaded in the same query
     comment = relationship("Comment")  # Relationship to the Comment model
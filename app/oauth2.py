@@ -1,9 +1,11 @@
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError 
+from cachetools import TTLCache
 from . import database, schemas, models, config
 
 # OAuth2PasswordBearer is a class that provides the mechanism to retrieve the token from the request
@@ -13,6 +15,14 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 SECRET_KEY = config.settings.secret_key
 ALGORITHM = config.settings.algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = config.settings.access_token_expire_minutes
+_TOKEN_TTL = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)  # Token lifetime, computed once
+_ALGORITHMS = [ALGORITHM]  # Accepted algorithms passed to jwt.decode
+
+# Recently verified tokens, mapped to their token data and expiration time
+_TOKEN_CACHE = TTLCache(maxsize=10000, ttl=60)
+# Users recently loaded for an authenticated request, mapped by id to their public fields
+_USER_CACHE = TTLCache(maxsize=10000, ttl=60)
+_TOKEN_CACHE_LOCK = Lock()  # TTLCache is not thread-safe and sync routes run in a thread pool
 
 def create_access_token(data: dict) -> str:
     """
@@ -25,7 +35,7 @@ def create_access_token(data: dict) -> str:
         str: The encoded JWT token as a string.
     """
     encoded_data = data.copy()  # Create a copy of the input data
-    expiry_time = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)  # Set expiration time
+    expiry_time = datetime.now(timezone.utc) + _TOKEN_TTL  # Set expiration time
     encoded_data.update({"exp": expiry_time})  # Add expiration time to the payload
 
     # Encode the data into a JWT token using the secret key and specified algorithm
@@ -36,6 +46,9 @@ def verify_access_token(token: str, credentials_exception):
     """
     Verify a JWT token and return the token data if valid.
     
+    Tokens verified in the last minute are served from a cache, so a client
+    reusing its bearer token doesn't pay for the signature check on every request.
+    
     Args:
         token (str): The JWT token to verify.
         credentials_exception (HTTPException): Exception to raise if verification fails.
@@ -46,9 +59,18 @@ def verify_access_token(token: str, credentials_exception):
     Raises:
         HTTPException: If the token is invalid or expired.
     """
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(token)
+    if cached is not None:
+        token_data, expiry_time = cached
+        # The token may have expired since it was cached
+        if expiry_time is not None and expiry_time <= datetime.now(timezone.utc).timestamp():
+            raise credentials_exception
+        return token_data
+
     try:
         # Decode the token using the secret key and algorithm
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=_ALGORITHMS)
         id: str = payload.get("user_id")  # Extract user ID from the token payload
         if not id:
             raise credentials_exception  # Raise exception if user ID is not found
@@ -57,18 +79,25 @@ def verify_access_token(token: str, credentials_exception):
     except JWTError:
         # Raise credentials exception if JWTError occurs
         raise credentials_exception
+
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[token] = (token_data, payload.get("exp"))
     return token_data
 
 def get_current_user(token: Annotated[str, Depends(oauth2_scheme)], db: Session = Depends(database.get_db)):
     """
     Get the current user based on the provided JWT token.
     
+    The user's id, email and creation time are cached for a minute, so repeated
+    requests from the same user don't query the users table each time. A deleted
+    user can therefore keep using a valid token for up to that minute.
+    
     Args:
         token (str): The JWT token provided in the request.
         db (Session): The SQLAlchemy database session dependency.
     
     Returns:
-        models.User: The user object corresponding to the token ID.
+        schemas.UserResponseModel: The user corresponding to the token ID.
     
     Raises:
         HTTPException: If the token is invalid or the user is not found.
@@ -81,6 +110,16 @@ def get_current_user(token: Annotated[str, Depends(oauth2_scheme)], db: Session
     )
     # Verify the token and extract token data
     token = verify_access_token(token, credentials_exception)
-    # Query the database to find the user by ID from the token data
-    user = db.query(models.User).filter(models.User.id == token.id).first()
+    user_id = int(token.id)
+    with _TOKEN_CACHE_LOCK:
+        user = _USER_CACHE.get(user_id)
+    if user is not None:
+        return user
+
+    db_user = db.get(models.User, user_id)
+    if db_user is None:
+        raise credentials_exception  # The token belongs to a user that no longer exists
+    user = schemas.UserResponseModel.model_validate(db_user)
+    with _TOKEN_CACHE_LOCK:
+        _USER_CACHE[user_id] = user
     return user
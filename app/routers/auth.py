@@ -17,8 +17,12 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), crud: CRUDService =
     if not user:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid Credentials")
 
-    if not utils.verify_hashed_password(form_data.password, user.password):
+    verified, new_hash = utils.verify_and_update_password(form_data.password, user.password)
+    if not verified:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid Credentials")
+    if new_hash:
+        # The stored hash used outdated settings, upgrade it now that we know the password
+        crud.update_user_password(user, new_hash)
     
     access_token = oauth2.create_access_token(data={"user_id": user.id})
    
@@ -1,5 +1,5 @@
 from typing import List
-from fastapi import Response, APIRouter, status, Depends, HTTPException
+from fastapi import Response, APIRouter, status, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from .. import database, schemas, oauth2, models
 from ..logger import get_logger
@@ -18,6 +18,13 @@ def comment_movie(comment_in: schemas.CommentCreate, db: Session = Depends(datab
     logger.info("User commented movie successfully.")
     return comment
 
+@router.get("/", status_code=status.HTTP_200_OK, response_model=List[schemas.MovieCommentResponseModel])
+def get_comments_for_movies(movie_ids: List[int] = Query(..., max_length=100), crud: CRUDService = Depends()):
+    logger.info("Retrieving comments for movies...")
+    movies = crud.get_movies_with_children(movie_ids, models.Movie, models.Movie.comments)
+    logger.info(f"Comments for {len(movies)} movies retrieved successfully")
+    return movies
+
 @router.get("/{movie_id}", status_code=status.HTTP_200_OK, response_model=schemas.MovieCommentResponseModel)
 def get_comments(movie_id: int, db: Session = Depends(database.get_db), crud: CRUDService = Depends()): 
     movie = crud.get(movie_id, models.Movie)
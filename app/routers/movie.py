@@ -1,5 +1,6 @@
+import io
 from typing import List, Optional
-from fastapi import Response, APIRouter, status, Depends, HTTPException
+from fastapi import Response, APIRouter, status, Body, Depends, HTTPException, Query, UploadFile
 from .. import schemas, oauth2, models
 from ..crud import CRUDService
 from ..logger import get_logger
@@ -13,8 +14,26 @@ def create_movie(movie_in: schemas.MovieCreate, current_user = Depends(oauth2.ge
     logger.info(f"Movie created successfully...")
     return movie
 
+@router.post("/bulk", status_code=status.HTTP_201_CREATED, response_model=List[schemas.MovieResponseModel])
+def create_movies(movies_in: List[schemas.MovieCreate] = Body(..., max_length=1000), current_user = Depends(oauth2.get_current_user), crud: CRUDService = Depends()):
+    movies = crud.bulk_create(movies_in, models.Movie, current_user)
+    logger.info(f"{len(movies)} movies created successfully...")
+    return movies
+
+@router.post("/import", status_code=status.HTTP_201_CREATED, response_model=schemas.MovieImportResponseModel)
+def import_movies(file: UploadFile, current_user = Depends(oauth2.get_current_user), crud: CRUDService = Depends()):
+    logger.info(f"Importing movies from {file.filename}...")
+    csv_file = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")  # utf-8-sig drops the BOM Excel writes
+    try:
+        imported = crud.bulk_ingest_movies(csv_file, models.Movie, current_user)
+    except ValueError as error:
+        logger.error(str(error))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+    logger.info(f"{imported} movies imported successfully.")
+    return {"imported": imported}
+
 @router.get("/", status_code=status.HTTP_200_OK, response_model=List[schemas.MovieResponseModel])
-def get_movies(limit: int = 10, skip: int = 0, search: Optional[str] = '', crud: CRUDService = Depends()):
+def get_movies(limit: int = Query(10, ge=1, le=100), skip: int = Query(0, ge=0), search: Optional[str] = '', crud: CRUDService = Depends()):
     logger.info("Getting movies...")
     movies = crud.get_movie(models.Movie, limit, skip, search)
     logger.info("Movies retrieved successfully.")
@@ -1,5 +1,5 @@
 from typing import List
-from fastapi import APIRouter, status, Depends, HTTPException
+from fastapi import APIRouter, status, Depends, HTTPException, Query
 from .. import database, schemas, models, oauth2
 from ..logger import get_logger
 from ..crud import CRUDService
@@ -13,13 +13,19 @@ def rate_movie(rating_in: schemas.RatingCreate, current_user = Depends(oauth2.ge
     logger.info("Rating movie...")
     if not movie:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND , detail=f"Movie with id:{rating_in.movie_id} not found")
-    existing_rating = crud.get_existing_rating(rating_in, models.Rating, current_user)
-    if existing_rating:
-        raise HTTPException(status_code= status.HTTP_400_BAD_REQUEST, detail="User has already rated this movie")
     rating = crud.rate_movie(rating_in, models.Rating, current_user) 
+    if not rating:
+        raise HTTPException(status_code= status.HTTP_400_BAD_REQUEST, detail="User has already rated this movie")
     logger.info("Movie rated successfully.")
     return rating
 
+@router.get("/", status_code=status.HTTP_200_OK, response_model=List[schemas.MovieRatingResponseModel])
+def get_ratings_for_movies(movie_ids: List[int] = Query(..., max_length=100), crud: CRUDService = Depends()):
+    logger.info("Retrieving ratings for movies...")
+    movies = crud.get_movies_with_children(movie_ids, models.Movie, models.Movie.ratings)
+    logger.info(f"Ratings for {len(movies)} movies retrieved successfully")
+    return movies
+
 @router.get("/{movie_id}", status_code=status.HTTP_200_OK, response_model=schemas.MovieRatingResponseModel)
 def get_ratings_for_movie(movie_id: int, crud: CRUDService = Depends()):
     movie = crud.get(movie_id, models.Movie)
@@ -1,13 +1,12 @@
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 # Base model for user data used in requests and responses
 class UserBase(BaseModel):
     email: EmailStr  
 
-    class Config:
-        from_attributes = True  # Allows using attributes directly from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)  # Allows using attributes directly from SQLAlchemy models
 
 # Model for representing a user in responses with additional fields
 class UserResponseModel(BaseModel):
@@ -15,15 +14,13 @@ class UserResponseModel(BaseModel):
     email: EmailStr  
     created_at: datetime  
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Model for creating a new user, including password
 class UserCreate(UserBase):
     password: str 
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Base model for movie data used in requests
 class MovieBase(BaseModel):
@@ -41,8 +38,7 @@ class MovieResponseModel(BaseModel):
     user_id: int  
     user: UserResponseModel  
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Model for creating a new movie
 class MovieCreate(MovieBase):
@@ -52,6 +48,10 @@ class MovieCreate(MovieBase):
 class MovieUpdate(MovieBase):
     pass  # Inherits all fields from MovieBase, no additional fields
 
+# Model for reporting the result of a movie CSV import
+class MovieImportResponseModel(BaseModel):
+    imported: int  # Number of movies loaded from the file
+
 # Base model for rating data used in requests
 class RatingBase(BaseModel):
     movie_id: int  
@@ -65,8 +65,7 @@ class RatingResponseModel(BaseModel):
     movie: MovieResponseModel  
     user_id: int 
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Model for creating a new rating
 class RatingCreate(RatingBase):
@@ -95,8 +94,7 @@ class CommentResponseModel(BaseModel):
     movie: MovieResponseModel  # Movie being commented on, represented as a MovieResponseModel
     created_at: datetime  # Timestamp for when the comment was created
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Model for creating a new comment
 class CommentCreate(CommentBase):
@@ -108,8 +106,7 @@ class Rating(BaseModel):
     rating: float 
     user_id: int 
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Model for representing a movie with its associated ratings
 class MovieRatingResponseModel(BaseModel):
@@ -120,8 +117,7 @@ class MovieRatingResponseModel(BaseModel):
     user_id: int  
     ratings: List[Rating]  
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Model for representing a comment without any additional details
 class Comment(BaseModel):
@@ -129,8 +125,7 @@ class Comment(BaseModel):
     content: str  
     user_id: int  
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Model for representing a movie with its associated comments
 class MovieCommentResponseModel(BaseModel):
@@ -141,8 +136,7 @@ class MovieCommentResponseModel(BaseModel):
     user_id: int  
     comments: List[Comment] 
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Model for creating a reply to a comment
 class ReplyCreate(BaseModel):
@@ -1,56 +1,163 @@
+import os
+
+# Password hashing settings are read when the app is imported, so set them first
+os.environ.setdefault("TESTING", "1")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")  # Used when the suite is run with TESTING=0
+
 import jwt
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert, text
 from ..main import app
-from .. import models, database, schemas, oauth2
-from config import settings
+from .. import models, database, schemas, utils
+from ..config import settings
 
 
-DATABASE_URL = f'postgresql://{settings.database_username}:{settings.database_password}@{settings.database_hostname}:{settings.database_port}/{settings.database_name}'
-engine = create_engine(DATABASE_URL)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-                        
-@pytest.fixture
-def session():
+SERVER_URL = f'postgresql://{settings.database_username}:{settings.database_password}@{settings.database_hostname}:{settings.database_port}'
+# Each pytest-xdist worker gets its own database so parallel test files never share tables
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_NAME = f"{settings.database_name}_test_{WORKER_ID}"
+DATABASE_URL = f"{SERVER_URL}/{TEST_DATABASE_NAME}"
+# Test data is disposable, so commits don't need to wait for the WAL to reach disk
+engine = create_engine(DATABASE_URL, echo=False, connect_args={"options": "-c synchronous_commit=off"})
+# Match the app's sessions: no autoflush and no re-SELECT of attributes after a commit
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+
+@pytest.fixture(scope="session", autouse=True)
+def test_database():
+    """
+    Create this worker's test database if it doesn't exist yet.
+    """
+    admin_engine = create_engine(f"{SERVER_URL}/{settings.database_name}", isolation_level="AUTOCOMMIT")
+    with admin_engine.connect() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": TEST_DATABASE_NAME}
+        ).scalar()
+        if not exists:
+            connection.execute(text(f'CREATE DATABASE "{TEST_DATABASE_NAME}"'))
+    admin_engine.dispose()
+
+@pytest.fixture(scope="session")
+def tables(test_database):
+    """
+    Create a fresh schema once for the whole test session.
+    """
     models.Base.metadata.drop_all(bind=engine)
-    models.Base.metadata.create_all(bind=engine) 
-    db = TestingSessionLocal()
+    models.Base.metadata.create_all(bind=engine)
+
+@pytest.fixture
+def session(tables):
+    """
+    A session whose work is rolled back after each test.
+    
+    Everything runs inside an outer transaction on a dedicated connection; the
+    session's own commits only release savepoints, so rolling back the outer
+    transaction leaves the tables empty again without any DDL.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield db
     finally:
         db.close()
+        transaction.rollback()
+        connection.close()
+
+@pytest.fixture(scope="session")
+def app_client():
+    """
+    A single TestClient (and app lifespan) shared by the whole test session.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
 
 @pytest.fixture
-def client(session): 
+def client(app_client, session): 
     def override_get_db(): 
-        try:
-            yield session
-        finally:
-            session.close()
+        yield session  # The session fixture closes and rolls back the session
     app.dependency_overrides[database.get_db] = override_get_db 
-    yield TestClient(app)
+    yield app_client
+    # Reset per-test state on the shared client
+    app.dependency_overrides.clear()
+    app_client.headers.pop("Authorization", None)
+    app_client.cookies.clear()
 
-@pytest.fixture
-def test_user(client):
-    user_data = {
+def post_outside_test_transaction(app_client, url, **kwargs):
+    """
+    Send a POST request whose database changes are committed for the rest of
+    the test session instead of being rolled back after a single test.
+    """
+    db = TestingSessionLocal()
+    def override_get_db():
+        yield db
+    # Session fixtures can be set up mid-test, after client installed its own override
+    previous_override = app.dependency_overrides.get(database.get_db)
+    app.dependency_overrides[database.get_db] = override_get_db
+    try:
+        return app_client.post(url, **kwargs)
+    finally:
+        if previous_override:
+            app.dependency_overrides[database.get_db] = previous_override
+        else:
+            app.dependency_overrides.pop(database.get_db, None)
+        db.close()
+
+SEED_USERS = [
+    {
         "email": "peterimade6@gmail.com",
         "password": "514500"
-    }
-    response = client.post("/users", json=user_data) 
-    assert response.status_code == status.HTTP_201_CREATED
-    new_user = response.json()
-    new_user['password'] = user_data['password'] 
-    return new_user
+    },
+    {
+        "email": "peterosas345@gmail.com",
+        "password": "12345"
+    },
+]
+# Hash each seed password once at import instead of on every registration
+SEED_PASSWORD_HASHES = {user_data['password']: utils.hash_password(user_data['password']) for user_data in SEED_USERS}
+
+@pytest.fixture(scope="session")
+def seed_users(tables):
+    """
+    Insert the two test users once per session; every test sees them.
+    
+    Rows go straight into the table with precomputed hashes, bypassing the API;
+    test_create_user still covers registration through POST /users.
+    """
+    db = TestingSessionLocal()
+    try:
+        rows = [
+            {"email": user_data['email'], "password": SEED_PASSWORD_HASHES[user_data['password']]}
+            for user_data in SEED_USERS
+        ]
+        created = db.scalars(insert(models.User).returning(models.User, sort_by_parameter_order=True), rows).all()
+        db.commit()
+        users = [
+            {
+                "id": user.id,
+                "email": user.email,
+                "created_at": user.created_at.isoformat(),
+                "password": user_data['password']
+            }
+            for user, user_data in zip(created, SEED_USERS)
+        ]
+    finally:
+        db.close()
+    return users
 
 @pytest.fixture
-def test_user_two(client):
+def test_user_api(client):
+    """
+    Register a fresh user through POST /users, for tests that cover registration itself.
+    
+    Tests that only need a user to exist should use the seeded test_user instead.
+    """
     user_data = {
-        "email": "peterosas345@gmail.com",
-        "password": "12345"
+        "email": "jengreat94@gmail.com",
+        "password": "514500"
     }
     response = client.post("/users", json=user_data) 
     assert response.status_code == status.HTTP_201_CREATED
@@ -59,14 +166,39 @@ def test_user_two(client):
     return new_user
 
 @pytest.fixture
-def token(test_user):
-    return oauth2.create_access_token({"user_id": test_user['id']})
+def test_user(seed_users):
+    return dict(seed_users[0])
+
+@pytest.fixture
+def test_user_two(seed_users):
+    return dict(seed_users[1])
+
+@pytest.fixture(scope="session")
+def token(app_client, seed_users):
+    """
+    Log the first test user in once and reuse the token for the whole session.
+    """
+    response = post_outside_test_transaction(app_client, "/login", data={
+        "username": seed_users[0]['email'],
+        "password": seed_users[0]['password']
+    })
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()['access_token']
 
 @pytest.fixture
 def authorized_client(client, token):
     client.headers.update({"Authorization": f"Bearer {token}"})
     return client
 
+def _bulk_insert(session, model, rows):
+    """
+    Insert all rows in one executemany, without building ORM objects first,
+    and return the inserted records in id order.
+    """
+    session.bulk_insert_mappings(model, rows)
+    session.commit()
+    return session.query(model).order_by(model.id).all()
+
 @pytest.fixture
 def test_movies(test_user, test_user_two, session):
     movies_data = [
@@ -108,18 +240,7 @@ def test_movies(test_user, test_user_two, session):
         },
     ]
 
-    def create_movie_model(movie):
-        return models.Movie(**movie)
-
-    movie_map = map(create_movie_model, movies_data)
-    
-    movies = list(movie_map)
-
-    session.add_all(movies)
-
-    session.commit()
-    movies = session.query(models.Movie).all()
-    return movies
+    return _bulk_insert(session, models.Movie, movies_data)
 
 
 @pytest.fixture
@@ -147,18 +268,7 @@ def test_ratings(session, test_user, test_user_two, test_movies):
         }
     ]
 
-    def create_rating_model(rating):
-        return models.Rating(**rating)
-
-    rating_map = map(create_rating_model, ratings_data)
-    
-    ratings = list(rating_map)
-
-    session.add_all(ratings)
-
-    session.commit()
-    ratings = session.query(models.Rating).all()
-    return ratings
+    return _bulk_insert(session, models.Rating, ratings_data)
 
 
 @pytest.fixture
@@ -181,15 +291,4 @@ def test_comments(session, test_user, test_user_two, test_movies):
         }
     ]
 
-    def create_comment_model(comment):
-        return models.Comment(**comment)
-
-    comment_map = map(create_comment_model, comments_data)
-    
-    comments = list(comment_map)
-
-    session.add_all(comments)
-
-    session.commit()
-    comments = session.query(models.Comment).all()
-    return comments
+    return _bulk_insert(session, models.Comment, comments_data)
@@ -1,7 +1,11 @@
 from fastapi import FastAPI, HTTPException, status
 import pytest 
-from .database import client, session
+import bcrypt
+from datetime import datetime, timedelta
+from cachetools import TTLCache
 from jose import jwt, JWTError 
+from .. import models, oauth2
+from ..config import settings
 from ..schemas import Token
 
 def test_login(client, test_user):
@@ -17,6 +21,23 @@ def test_login(client, test_user):
     assert token.token_type == "bearer"
     assert id == test_user['id']
 
+def test_login_upgrades_outdated_hash(client, session, monkeypatch):
+    # Hash for real with bcrypt, at a higher cost than the stored hash below
+    monkeypatch.setattr(settings, "testing", False)
+    monkeypatch.setattr(settings, "bcrypt_rounds", 5)
+    outdated_hash = bcrypt.hashpw(b"rehash-me", bcrypt.gensalt(rounds=4)).decode("utf-8")
+    user = models.User(email="rehash@gmail.com", password=outdated_hash)
+    session.add(user)
+    session.commit()
+
+    response = client.post("/login", data={"username": "rehash@gmail.com", "password": "rehash-me"})
+
+    assert response.status_code == status.HTTP_201_CREATED
+    session.refresh(user)
+    assert user.password != outdated_hash
+    assert user.password.split("$")[2] == "05"
+    assert bcrypt.checkpw(b"rehash-me", user.password.encode("utf-8"))
+
 @pytest.mark.parametrize("email, password, status_code", [
     ("peterimade6@gmail.com", "78769", status.HTTP_403_FORBIDDEN),
     ("peterosas6@gmail.com", "514500", status.HTTP_403_FORBIDDEN),
@@ -31,4 +52,45 @@ def test_incorrect_login(client, email, password, status_code):
         "password": password
     })
 
-    assert response.status_code == status_code 
\ No newline at end of file
+    assert response.status_code == status_code 
+def test_token_for_missing_user(client):
+    # A validly signed token whose user doesn't exist
+    token = oauth2.create_access_token(data={"user_id": 8000})
+    client.headers.update({"Authorization": f"Bearer {token}"})
+    response = client.post("/movies", json={"title": "The Punisher", "genre": "Action thriller", "director": "Marvel Studios"})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    # An empty token cache per test, so cached tokens don't leak between tests
+    cache = TTLCache(maxsize=10, ttl=60)
+    monkeypatch.setattr(oauth2, "_TOKEN_CACHE", cache)
+    return cache
+
+def test_cached_token_reuses_token_data(token_cache, monkeypatch):
+    token = oauth2.create_access_token(data={"user_id": 1})
+    credentials_exception = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    token_data = oauth2.verify_access_token(token, credentials_exception)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("jwt.decode called for a cached token")
+    monkeypatch.setattr(oauth2.jwt, "decode", fail_decode)
+
+    assert oauth2.verify_access_token(token, credentials_exception) is token_data
+
+def test_cached_token_rejected_after_expiry(token_cache, monkeypatch):
+    token = oauth2.create_access_token(data={"user_id": 1})
+    credentials_exception = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    oauth2.verify_access_token(token, credentials_exception)
+    assert token in token_cache
+
+    class ExpiredClock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + oauth2._TOKEN_TTL + timedelta(seconds=1)
+    monkeypatch.setattr(oauth2, "datetime", ExpiredClock)
+
+    with pytest.raises(HTTPException) as error:
+        oauth2.verify_access_token(token, credentials_exception)
+    assert error.value is credentials_exception
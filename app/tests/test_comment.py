@@ -3,7 +3,7 @@ from fastapi import status
 
 def test_comment_movie(authorized_client, test_movies):
     response = authorized_client.post("/comments", json={
-        "movie_id": 1,
+        "movie_id": test_movies[0].id,
         "content": "Interesting!"
     })
     assert response.status_code == status.HTTP_201_CREATED
@@ -19,4 +19,10 @@ def test_comment_movie_not_found(authorized_client, test_movies):
 
 def test_get_comments(client, test_movies):
     response = client.get(f"/comments/{test_movies[0].id}")
-    assert response.status_code == status.HTTP_200_OK
\ No newline at end of file
+    assert response.status_code == status.HTTP_200_OK
+
+def test_get_comments_for_movies(client, test_comments):
+    movie_ids = sorted({comment.movie_id for comment in test_comments})
+    response = client.get("/comments", params={"movie_ids": movie_ids})
+    assert response.status_code == status.HTTP_200_OK
+    assert sum(len(movie['comments']) for movie in response.json()) == len(test_comments)
\ No newline at end of file
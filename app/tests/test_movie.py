@@ -18,8 +18,8 @@ def test_create_movie(authorized_client, test_user, title, genre, director):
         "director": director
     })
 
-    # Parse the response into a MovieResponseModel object
-    new_movie = schemas.MovieResponseModel(**response.json())
+    # Wrap the response in a MovieResponseModel without re-validating it (the server already did)
+    new_movie = schemas.MovieResponseModel.model_construct(**response.json())
     
     # Check that the response status code is 201 Created
     assert response.status_code == status.HTTP_201_CREATED  
@@ -28,15 +28,104 @@ def test_create_movie(authorized_client, test_user, title, genre, director):
     # Ensure the movie is associated with the correct user
     assert new_movie.user_id == test_user['id']
 
-def test_unauthorized_user_create_movie(client):
+def test_create_movies_bulk(authorized_client, test_user):
     """
-    Test that an unauthorized user cannot create a movie.
+    Test creating several movies in a single request.
+    """
+    movies_data = [
+        {"title": "The Punisher", "genre": "Action thriller", "director": "Marvel Studios"},
+        {"title": "The Awakening", "genre": "Horror", "director": "AJS Studios"},
+        {"title": "Twilight series", "genre": "Mystery", "director": "Universal Studios"}
+    ]
+    # Send a POST request to create all the movies at once
+    response = authorized_client.post("/movies/bulk", json=movies_data)
+
+    new_movies = [schemas.MovieResponseModel.model_construct(**movie) for movie in response.json()]
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [movie.title for movie in new_movies] == [movie["title"] for movie in movies_data]
+    # Ensure every movie is associated with the correct user
+    assert all(movie.user_id == test_user['id'] for movie in new_movies)
+
+def test_create_movies_bulk_too_many(authorized_client):
+    """
+    Test that a bulk request with more than 1000 movies is rejected.
+    """
+    movies_data = [{"title": f"Movie {i}", "genre": "Drama", "director": "AJS Studios"} for i in range(1001)]
+    response = authorized_client.post("/movies/bulk", json=movies_data)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_import_movies(authorized_client, test_user):
+    """
+    Test importing movies from a CSV file.
+    """
+    csv_data = "director,title,genre\nMarvel Studios,The Punisher,Action thriller\nAJS Studios,\"The Awakening, Part 2\",Horror\n"
+    # Upload the CSV file; columns may come in any order
+    response = authorized_client.post("/movies/import", files={"file": ("movies.csv", csv_data, "text/csv")})
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()['imported'] == 2
+
+    movies = authorized_client.get("/movies").json()
+    assert [movie['title'] for movie in movies] == ["The Punisher", "The Awakening, Part 2"]
+    assert all(movie['user_id'] == test_user['id'] for movie in movies)
+
+def test_import_movies_with_bom(authorized_client):
+    """
+    Test importing a CSV file that starts with a UTF-8 byte order mark, as Excel writes it.
+    """
+    csv_data = "\ufefftitle,genre,director\nThe Punisher,Action thriller,Marvel Studios\n".encode("utf-8")
+    response = authorized_client.post("/movies/import", files={"file": ("movies.csv", csv_data, "text/csv")})
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()['imported'] == 1
+
+def test_import_movies_missing_column(authorized_client):
+    """
+    Test that a CSV file without all movie columns is rejected.
+    """
+    response = authorized_client.post("/movies/import", files={"file": ("movies.csv", "title,genre\nThe Punisher,Action\n", "text/csv")})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_import_movies_empty_field(authorized_client):
+    """
+    Test that an empty CSV field is imported as an empty string.
+    """
+    response = authorized_client.post("/movies/import", files={"file": ("movies.csv", "title,genre,director\n,Action,Marvel Studios\n", "text/csv")})
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert authorized_client.get("/movies").json()[0]['title'] == ""
+
+@pytest.mark.parametrize("csv_data", [
+    "title,genre,director\nThe Punisher,Action\n",  # Short row
+    "title,genre,director\nThe Punisher,Action\x00,Marvel Studios\n"  # Rejected by PostgreSQL
+])
+def test_import_movies_invalid_row(authorized_client, csv_data):
+    """
+    Test that a CSV file with an invalid row is rejected without importing anything.
+    """
+    response = authorized_client.post("/movies/import", files={"file": ("movies.csv", csv_data, "text/csv")})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert authorized_client.get("/movies").json() == []
+
+@pytest.mark.parametrize("method, path", [
+    ("post", "/movies"),
+    ("delete", "/movies/{id}"),
+    ("put", "/movies/{id}")
+])
+def test_unauthorized_user_modify_movie(client, test_movies, method, path):
+    """
+    Test that an unauthorized user cannot create, delete or update a movie.
     
     Args:
         client: A test client instance without authorization.
+        test_movies: Fixture providing a list of test movies.
     """
-    # Send a POST request to create a movie without authorization
-    response = client.post("/movies", json={
+    # Send the request without authorization
+    response = client.request(method, path.format(id=test_movies[0].id), json={
         "title": "The Punisher", 
         "genre": "Action thriller", 
         "director": "Marvel Studios"
@@ -55,19 +144,24 @@ def test_get_all_movies(client, test_movies):
     """
     # Send a GET request to retrieve all movies
     response = client.get("/movies") 
-
-    # Validate the response data
-    def validate(movie):
-        return schemas.MovieResponseModel(**movie)
-    
-    # Map response data to MovieResponseModel objects
-    movies_map = map(validate, response.json())
-    movies_list = list(movies_map)
+    body = response.json()
     
     # Check that the number of movies returned matches the number of test movies
-    assert len(response.json()) == len(test_movies) 
+    assert len(body) == len(test_movies) 
     assert response.status_code == status.HTTP_200_OK   
-    assert movies_list[0].id == test_movies[0].id
+    # Only the first movie is inspected, so only it is parsed into a MovieResponseModel
+    assert schemas.MovieResponseModel(**body[0]).id == test_movies[0].id
+
+def test_get_movies_limit_too_large(client):
+    """
+    Test that page sizes above the maximum are rejected.
+    
+    Args:
+        client: A test client instance without authorization.
+    """
+    response = client.get("/movies", params={"limit": 101})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 def test_get_one_movie(client, test_movies):
     """
@@ -79,38 +173,30 @@ def test_get_one_movie(client, test_movies):
     """
     # Send a GET request to retrieve a specific movie by ID
     response = client.get(f"/movies/{test_movies[0].id}")
-    movie = schemas.MovieResponseModel(**response.json())
+    movie = schemas.MovieResponseModel.model_construct(**response.json())
     
     assert response.status_code == status.HTTP_200_OK
     assert movie.title == test_movies[0].title
 
-def test_get_one_movie_not_exist(client):
+@pytest.mark.parametrize("method", ["get", "delete", "put"])
+def test_movie_not_exist(authorized_client, method):
     """
-    Test retrieving a movie that does not exist.
+    Test retrieving, deleting or updating a movie that does not exist.
     
     Args:
-        client: A test client instance without authorization.
+        authorized_client: A test client instance with authorization.
     """
-    id = 223
-    # Send a GET request for a movie with a non-existent ID
-    response = client.get(f"/movies/{id}")
+    id = 8000
+    # Send the request for a movie with a non-existent ID
+    response = authorized_client.request(method, f"/movies/{id}", json={
+        "title": "Man of Steel",
+        "genre": "Superhero",
+        "director": "DC Comics"
+    })
     
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert response.json()['detail'] == f"Movie with id:{id} not found"
 
-def test_unauthorized_user_delete_movie(client, test_movies):
-    """
-    Test that an unauthorized user cannot delete a movie.
-    
-    Args:
-        client: A test client instance without authorization.
-        test_movies: Fixture providing a list of test movies.
-    """
-    # Send a DELETE request to remove a movie without authorization
-    response = client.delete(f"/movies/{test_movies[0].id}")
-    
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
 def test_delete_movie(authorized_client, test_movies):
     """
     Test deleting a movie by an authorized user.
@@ -124,18 +210,6 @@ def test_delete_movie(authorized_client, test_movies):
     
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
-def test_delete_movie_non_exist(authorized_client):
-    """
-    Test deleting a movie that does not exist.
-    
-    Args:
-        authorized_client: A test client instance with authorization.
-    """
-    # Send a DELETE request for a movie with a non-existent ID
-    response = authorized_client.delete(f"/movies/8000")
-    
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-
 def test_delete_other_user_movie(authorized_client, test_movies, test_user_two):
     """
     Test that an authorized user cannot delete a movie owned by another user.
@@ -166,8 +240,8 @@ def test_update_movie(authorized_client, test_movies):
     # Send a PUT request to update a movie's details
     response = authorized_client.put(f"/movies/{test_movies[0].id}", json=data)
 
-    # Parse the response into a MovieResponseModel object
-    updated_movie = schemas.MovieResponseModel(**response.json())
+    # Wrap the response in a MovieResponseModel object
+    updated_movie = schemas.MovieResponseModel.model_construct(**response.json())
     
     assert response.status_code == status.HTTP_200_OK
     assert updated_movie.title == data['title']
@@ -190,29 +264,4 @@ def test_update_other_user_movie(authorized_client, test_movies, test_user_two):
     # Send a PUT request to update a movie owned by a different user
     response = authorized_client.put(f"/movies/{test_movies[3].id}", json=data)
     
-    assert response.status_code == status.HTTP_403_FORBIDDEN
-
-def test_unauthorized_user_update_movie(client, test_movies):
-    """
-    Test that an unauthorized user cannot update a movie.
-    
-    Args:
-        client: A test client instance without authorization.
-        test_movies: Fixture providing a list of test movies.
-    """
-    # Send a PUT request to update a movie without authorization
-    response = client.put(f"/movies/{test_movies[0].id}")
-    
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-def test_update_movie_non_exist(authorized_client):
-    """
-    Test updating a movie that does not exist.
-    
-    Args:
-        authorized_client: A test client instance with authorization.
-    """
-    # Send a PUT request for a movie with a non-existent ID
-    response = authorized_client.put(f"/movies/8000")
-    
-    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.status_code == status.HTTP_403_FORBIDDEN
\ No newline at end of file
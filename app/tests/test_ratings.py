@@ -11,7 +11,7 @@ def test_rate_movie(authorized_client, test_movies):
     """
     # Define the rating data for the movie
     response = authorized_client.post("/ratings", json= {
-        "movie_id": 1,  # Assume movie with ID 1 exists
+        "movie_id": test_movies[0].id,
         "rating": 3
     })
     # Verify that the response status code is 201 Created
@@ -60,4 +60,19 @@ def test_get_ratings_for_movie(client, test_ratings):
         test_ratings: Fixture providing test ratings data.
     """
     response = client.get(f"/ratings/{test_ratings[0].movie_id}")
-    assert response.status_code == status.HTTP_200_OK
\ No newline at end of file
+    assert response.status_code == status.HTTP_200_OK
+
+def test_get_ratings_for_movies(client, test_ratings):
+    """
+    Test retrieving ratings for several movies in one request.
+    
+    Args:
+        client: A test client instance without authorization.
+        test_ratings: Fixture providing test ratings data.
+    """
+    movie_ids = sorted({rating.movie_id for rating in test_ratings})
+    response = client.get("/ratings", params={"movie_ids": movie_ids})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [movie['id'] for movie in response.json()] == movie_ids
+    assert sum(len(movie['ratings']) for movie in response.json()) == len(test_ratings)
\ No newline at end of file
